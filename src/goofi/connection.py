@@ -1,16 +1,37 @@
+import atexit
+import mmap
+import os
 import pickle
 import queue
+import sys
 import tempfile
 import threading
 import time
 from abc import ABC, abstractmethod
-from multiprocessing import Pipe
+from collections import OrderedDict
+from multiprocessing import Pipe, resource_tracker
 from multiprocessing.connection import _ConnectionBase
 from multiprocessing.managers import BaseManager
-from typing import Dict, Tuple, Type
+from multiprocessing.reduction import ForkingPickler
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
 
+import numpy as np
 import zmq
 
+try:
+    # NOTE: _posixshmem is the private CPython module behind multiprocessing.shared_memory. It is used to map
+    # segments of other processes without registering them with this process' resource tracker, which would
+    # unlink them when this process exits. SharedArrayPool._attach falls back to SharedMemory without it.
+    import _posixshmem
+except ImportError:
+    _posixshmem = None
+
+from goofi.data import Data, DataType
+
+# arrays above this size are sent through shared memory by the multiprocessing backend
+SHARED_MEMORY_THRESHOLD = 64 * 1024
+
 
 class Connection(ABC):
     _CONNECTION_IDS = None
@@ -306,3 +327,261 @@ class IPCZeroMQConnection(ZeroMQConnection):
     @staticmethod
     def protocol() -> str:
         return "ipc"
+
+
+class SharedMemoryFreedError(RuntimeError):
+    """
+    Raised when a received message references a shared memory segment that was already freed by its owner. This
+    is not an OSError, which the connection would treat as being closed, so the message can be dropped instead.
+    """
+
+
+class SharedArrayPool:
+    """
+    A per-process pool of shared memory segments used to send large arrays through multiprocessing pipes without
+    pickling them. Each segment starts with a header whose first byte marks the segment as busy while a message
+    referencing it is in flight. The receiving end clears the flag once it copied the array out of the segment,
+    after which the segment is reused for the next array that fits into it.
+
+    Segment sizes are rounded up to powers of two so streams with varying array sizes reuse a few segment sizes,
+    and the total size of the pool is bounded by evicting free segments of the least recently used sizes.
+
+    Segments are owned (and unlinked) by the process that created them. Receivers keep a bounded number of
+    mappings of segments open so repeated transfers don't have to map the segment again.
+    """
+
+    HEADER_SIZE = 64
+    MAX_SEGMENTS_PER_SIZE = 4
+    MAX_POOL_BYTES = 64 * 1024 * 1024
+    MAX_ATTACHED = 32
+
+    def __init__(self) -> None:
+        self.reset()
+
+    @staticmethod
+    def capacity(nbytes: int) -> int:
+        """Round `nbytes` up to the next power of two, which is the data capacity of the segment used for it."""
+        return 1 << (nbytes - 1).bit_length()
+
+    def acquire(self, nbytes: int) -> Optional[SharedMemory]:
+        """
+        Get a free segment with room for `nbytes` bytes of data and mark it as busy.
+
+        ### Parameters
+        `nbytes` : int
+            The number of bytes the segment needs to hold.
+
+        ### Returns
+        `Optional[SharedMemory]`
+            The segment, or None if no segment is available and the pool can't grow.
+        """
+        capacity = self.capacity(nbytes)
+        size = self.HEADER_SIZE + capacity
+        with self.lock:
+            if self.closed or size > self.MAX_POOL_BYTES:
+                # the pool is shutting down or the array doesn't fit into the pool at all
+                return None
+
+            segments = self.segments.setdefault(capacity, [])
+            self.segments.move_to_end(capacity)
+            for shm in segments:
+                if shm.buf[0] == 0:
+                    shm.buf[0] = 1
+                    return shm
+
+            if len(segments) >= self.MAX_SEGMENTS_PER_SIZE:
+                # all segments are in flight (or were never received), fall back to pickling
+                return None
+            self._evict(self.MAX_POOL_BYTES - size)
+            if self.total_bytes + size > self.MAX_POOL_BYTES:
+                # the pool is full of segments that are in flight, fall back to pickling
+                return None
+
+            try:
+                shm = SharedMemory(create=True, size=size)
+            except OSError:
+                return None
+            shm.buf[0] = 1
+            segments.append(shm)
+            self.total_bytes += size
+            return shm
+
+    def _evict(self, max_bytes: int) -> None:
+        """Unlink free segments, starting with the least recently used sizes, until at most `max_bytes` are used."""
+        for capacity, segments in list(self.segments.items()):
+            if self.total_bytes <= max_bytes:
+                break
+            for shm in list(segments):
+                if self.total_bytes <= max_bytes:
+                    break
+                if shm.buf[0] == 0:
+                    segments.remove(shm)
+                    shm.close()
+                    shm.unlink()
+                    self.total_bytes -= self.HEADER_SIZE + capacity
+            if len(segments) == 0:
+                del self.segments[capacity]
+
+    def read(self, name: str, shape: Tuple[int, ...], dtype: np.dtype) -> np.ndarray:
+        """
+        Copy an array out of a segment created by another process, and mark the segment as free.
+
+        ### Parameters
+        `name` : str
+            The name of the shared memory segment.
+        `shape` : Tuple[int, ...]
+            The shape of the array.
+        `dtype` : np.dtype
+            The data type of the array.
+
+        ### Returns
+        `np.ndarray`
+            A copy of the array.
+        """
+        # hold the lock while the segment is accessed so the mapping can't be closed by another thread
+        with self.lock:
+            mm = self.attached.get(name)
+            if mm is None:
+                mm = self._attach(name)
+                self.attached[name] = mm
+                if len(self.attached) > self.MAX_ATTACHED:
+                    # unmap the least recently used segment, which may have been unlinked by its owner already
+                    self.attached.popitem(last=False)[1].close()
+            else:
+                self.attached.move_to_end(name)
+
+            buf = mm.buf if isinstance(mm, SharedMemory) else mm
+            arr = np.ndarray(shape, dtype, buffer=buf, offset=self.HEADER_SIZE).copy()
+            # mark the segment as free after the array was copied
+            buf[0] = 0
+        return arr
+
+    @staticmethod
+    def _attach(name: str) -> Union[mmap.mmap, SharedMemory]:
+        """Map a segment created by another process."""
+        # NOTE: SharedMemory(name=...) registers the segment with this process' resource tracker (Python < 3.13
+        # has no way to opt out), which unlinks the segment when this process exits and leaves the owner with a
+        # dangling segment. Open the segment directly instead, which is what SharedMemory does internally, and
+        # only use SharedMemory (and undo its registration) if the private module is not available.
+        try:
+            if _posixshmem is None:
+                return SharedArrayPool._attach_untracked(name)
+            fd = _posixshmem.shm_open("/" + name, os.O_RDWR, mode=0o600)
+        except FileNotFoundError:
+            raise SharedMemoryFreedError(f"Shared memory segment '{name}' was freed before the data was received.")
+        try:
+            return mmap.mmap(fd, os.fstat(fd).st_size)
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def _attach_untracked(name: str) -> SharedMemory:
+        """Map a segment created by another process through the public API, without tracking it in this process."""
+        if sys.version_info >= (3, 13):
+            return SharedMemory(name=name, track=False)
+
+        shm = SharedMemory(name=name)
+        # undo the registration, the owner of the segment unlinks it
+        resource_tracker.unregister(shm._name, "shared_memory")
+        return shm
+
+    def reset(self) -> None:
+        """Forget all segments without freeing them. Called in forked child processes, which don't own them."""
+        self.lock = threading.Lock()
+        self.closed = False
+        # segments by data capacity, ordered from the least to the most recently used capacity
+        self.segments: "OrderedDict[int, List[SharedMemory]]" = OrderedDict()
+        self.total_bytes = 0
+        # mappings of segments owned by other processes, ordered from the least to the most recently used
+        self.attached: "OrderedDict[str, Union[mmap.mmap, SharedMemory]]" = OrderedDict()
+
+    def close(self, timeout: float = 0.0) -> None:
+        """
+        Unlink all segments owned by this process. Arrays sent afterwards are pickled.
+
+        ### Parameters
+        `timeout` : float
+            Time in seconds to wait for receivers to copy arrays that are still in flight out of their segments.
+        """
+        with self.lock:
+            self.closed = True
+
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline and any(shm.buf[0] != 0 for segments in self.segments.values() for shm in segments):
+            time.sleep(0.01)
+
+        with self.lock:
+            for segments in self.segments.values():
+                for shm in segments:
+                    shm.close()
+                    shm.unlink()
+            self.segments.clear()
+            self.total_bytes = 0
+            for mm in self.attached.values():
+                mm.close()
+            self.attached.clear()
+
+
+_SHARED_ARRAYS = SharedArrayPool()
+if os.name == "posix":
+    os.register_at_fork(after_in_child=_SHARED_ARRAYS.reset)
+    # covers the main process, node processes exit without running atexit handlers and call free_shared_memory()
+    atexit.register(_SHARED_ARRAYS.close)
+
+
+def free_shared_memory(timeout: float = 0.0) -> None:
+    """
+    Unlink the shared memory segments this process created for sending large arrays. Must be called before a
+    process exits through `os._exit()` (e.g. a multiprocessing child), which skips the atexit handler.
+
+    ### Parameters
+    `timeout` : float
+        Time in seconds to wait for receivers to copy arrays that are still in flight.
+    """
+    _SHARED_ARRAYS.close(timeout)
+
+
+def _reduce_data(data: Data) -> Tuple:
+    """
+    Reduce a Data object for sending it through a multiprocessing pipe. Large arrays are copied into a pooled
+    shared memory segment and only the segment's name is pickled. The receiving end copies the array out of the
+    segment, so the segment can be reused regardless of how long downstream nodes hold on to the array.
+
+    Shared memory is only used on POSIX systems, where segments persist until they are unlinked.
+
+    ### Parameters
+    `data` : Data
+        The data object.
+
+    ### Returns
+    `Tuple`
+        The reduced data object.
+    """
+    arr = data.data
+    if os.name != "posix" or not isinstance(arr, np.ndarray) or arr.nbytes <= SHARED_MEMORY_THRESHOLD or arr.dtype.hasobject:
+        return data.__reduce_ex__(pickle.HIGHEST_PROTOCOL)
+
+    shm = _SHARED_ARRAYS.acquire(arr.nbytes)
+    if shm is None:
+        return data.__reduce_ex__(pickle.HIGHEST_PROTOCOL)
+
+    np.copyto(np.ndarray(arr.shape, arr.dtype, buffer=shm.buf, offset=SharedArrayPool.HEADER_SIZE), arr)
+    return _attach_shared_data, (data.dtype, shm.name, arr.shape, arr.dtype, data.meta)
+
+
+def _attach_shared_data(
+    dtype: DataType, name: str, shape: Tuple[int, ...], array_dtype: np.dtype, meta: Dict[str, Any]
+) -> Data:
+    """Rebuild a Data object whose array was sent through shared memory, and release the segment."""
+    arr = _SHARED_ARRAYS.read(name, shape, array_dtype)
+
+    # the data object was validated by the sender
+    data = object.__new__(Data)
+    data.dtype = dtype
+    data.data = arr
+    data.meta = meta
+    return data
+
+
+# pipes pickle using ForkingPickler, which leaves regular pickling and copying of Data objects unaffected
+ForkingPickler.register(Data, _reduce_data)
@@ -1,5 +1,6 @@
 import importlib
 import time
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from multiprocessing import Manager as MPManager
 from os import path
@@ -36,6 +37,8 @@ class NodeContainer:
 
     def __init__(self) -> None:
         self._nodes: Dict[str, NodeRef] = {}
+        # next free suffix for each base name, suffixes of removed nodes are not reused
+        self._next_idx: Dict[str, int] = {}
 
     def add_node(self, name: str, node: NodeRef, force_name: bool = False) -> str:
         """
@@ -63,9 +66,11 @@ class NodeContainer:
             return name
 
         # generate a unique name for the node
-        idx = 0
+        idx = self._next_idx.get(name, 0)
         while f"{name}{idx}" in self._nodes:
+            # the slot was taken by a node that was added with force_name=True
             idx += 1
+        self._next_idx[name] = idx + 1
         # register the node under the generated name
         self._nodes[f"{name}{idx}"] = node
         return f"{name}{idx}"
@@ -119,8 +124,8 @@ class Manager:
     ) -> None:
         # TODO: add proper logging
         print("Starting goofi-pipe...")
-        # preload all nodes to avoid delays
-        list_nodes(verbose=True)
+        # preload all nodes to avoid delays, and map (category, node type) to the node classes
+        self._node_types = {(node.category(), node.__name__): node for node in list_nodes(verbose=True)}
 
         # TODO: add proper logging
         mp_state = "enabled" if use_multiprocessing else "disabled"
@@ -260,9 +265,11 @@ class Manager:
         # TODO: add proper logging
         print(f"Adding node '{node_type}' from category '{category}'.")
 
-        # import the node
-        mod = importlib.import_module(f"goofi.nodes.{category}.{node_type.lower()}")
-        node = getattr(mod, node_type)
+        # look up the node class, and import it if it was not discovered on startup
+        node = self._node_types.get((category, node_type))
+        if node is None:
+            mod = importlib.import_module(f"goofi.nodes.{category}.{node_type.lower()}")
+            node = self._node_types[(category, node_type)] = getattr(mod, node_type)
 
         # instantiate the node
         ref = None
@@ -392,8 +399,12 @@ class Manager:
         print("Shutting down goofi-pipe manager.")
         # terminate the manager
         self._running = False
-        for node in self.nodes:
-            self.nodes[node].terminate()
+
+        # terminate all nodes in parallel so a slow or dead node doesn't hold up the others
+        refs = [self.nodes[name] for name in list(self.nodes)]
+        if len(refs) > 0:
+            with ThreadPoolExecutor(max_workers=min(32, len(refs))) as pool:
+                list(pool.map(lambda ref: ref.terminate(), refs))
 
     def save(self, filepath: Optional[str] = None, overwrite: bool = False, timeout: float = 3.0) -> None:
         """
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 
 from goofi.connection import Connection
 from goofi.data import Data
@@ -21,6 +21,8 @@ class MessageType(Enum):
     - `DATA`: Sent by one node to another and contains data sent from an output slot to an input slot.
         - `slot_name` (str): The name of the target input slot.
         - `data` (Data): The data object. See the `Data` class for more information.
+    - `DATA_BATCH`: Sent by one node to another and bundles multiple `DATA` messages for the same connection.
+        - `messages` (List[Message]): The bundled `DATA` messages.
     - `CLEAR_DATA`: Clear the data field on an input slot.
     - `PING`: Empty probe to check if a process is alive.
     - `PONG`: Response to a ping message.
@@ -50,6 +52,24 @@ class MessageType(Enum):
     PARAMETER_UPDATE = 9
     SERIALIZE_REQUEST = 10
     SERIALIZE_RESPONSE = 11
+    DATA_BATCH = 12
+
+
+# required content fields and their types for each message type, message types without an entry have no requirements
+CONTENT_FIELDS: Dict[MessageType, Tuple[Tuple[str, Any], ...]] = {
+    MessageType.ADD_OUTPUT_PIPE: (
+        ("slot_name_out", str),
+        ("slot_name_in", str),
+        ("node_connection", (Connection, type(None))),
+    ),
+    MessageType.REMOVE_OUTPUT_PIPE: (("slot_name_out", str), ("slot_name_in", str), ("node_connection", Connection)),
+    MessageType.DATA: (("slot_name", str), ("data", Data)),
+    MessageType.DATA_BATCH: (("messages", list),),
+    MessageType.CLEAR_DATA: (("slot_name", str),),
+    MessageType.PROCESSING_ERROR: (("error", str),),
+    MessageType.PARAMETER_UPDATE: (("group", str), ("param_name", str), ("param_value", object)),
+    MessageType.SERIALIZE_RESPONSE: (("_type", str), ("category", str), ("out_conns", dict), ("params", dict)),
+}
 
 
 @dataclass
@@ -66,9 +86,33 @@ class Message:
         The content of the message with required fields for the message type.
     """
 
+    # NOTE: slots are declared manually as dataclass(slots=True) requires Python>=3.10
+    __slots__ = ("type", "content")
+
     type: MessageType
     content: Dict[str, Any]
 
+    @classmethod
+    def unchecked(cls, type: MessageType, content: Dict[str, Any]) -> "Message":
+        """
+        Create a message without validating its content. Only use this for high-rate internal messages
+        whose content is known to be valid.
+
+        ### Parameters
+        `type` : MessageType
+            The type of the message.
+        `content` : Dict[str, Any]
+            The content of the message with required fields for the message type.
+
+        ### Returns
+        `Message`
+            The message.
+        """
+        msg = cls.__new__(cls)
+        msg.type = type
+        msg.content = content
+        return msg
+
     def require_fields(self, **fields: Dict[str, Any]) -> None:
         """
         Check that the message content contains the required fields.
@@ -77,13 +121,16 @@ class Message:
         `fields` : Dict[str, Any]
             A dictionary of required fields and their types.
         """
-        for field, field_type in fields.items():
-            if field not in self.content:
+        self._check_fields(tuple(fields.items()))
+
+    def _check_fields(self, fields: Tuple[Tuple[str, Any], ...]) -> None:
+        """Check the message content against a tuple of (field name, field type) pairs."""
+        content = self.content
+        for field, field_type in fields:
+            if field not in content:
                 raise ValueError(f"Message content must contain field {field}.")
-            if not isinstance(self.content[field], field_type):
-                raise ValueError(
-                    f"Message content field {field} must be of type {field_type} but got {type(self.content[field])}."
-                )
+            if not isinstance(content[field], field_type):
+                raise ValueError(f"Message content field {field} must be of type {field_type} but got {type(content[field])}.")
 
     def __post_init__(self):
         """
@@ -97,17 +144,6 @@ class Message:
             raise ValueError(f"Expected dict, got {type(self.content)}.")
 
         # check the content for the specific message type
-        if self.type == MessageType.ADD_OUTPUT_PIPE:
-            self.require_fields(slot_name_out=str, slot_name_in=str, node_connection=(Connection, type(None)))
-        elif self.type == MessageType.REMOVE_OUTPUT_PIPE:
-            self.require_fields(slot_name_out=str, slot_name_in=str, node_connection=Connection)
-        elif self.type == MessageType.DATA:
-            self.require_fields(slot_name=str, data=Data)
-        elif self.type == MessageType.CLEAR_DATA:
-            self.require_fields(slot_name=str)
-        elif self.type == MessageType.PROCESSING_ERROR:
-            self.require_fields(error=str)
-        elif self.type == MessageType.PARAMETER_UPDATE:
-            self.require_fields(group=str, param_name=str, param_value=object)
-        elif self.type == MessageType.SERIALIZE_RESPONSE:
-            self.require_fields(_type=str, category=str, out_conns=dict, params=dict)
+        fields = CONTENT_FIELDS.get(self.type)
+        if fields is not None:
+            self._check_fields(fields)
@@ -7,7 +7,7 @@ from os.path import dirname, join
 from threading import Event, Thread
 from typing import Any, Callable, Dict, Optional, Tuple, Union
 
-from goofi.connection import Connection
+from goofi.connection import Connection, free_shared_memory
 from goofi.data import Data, DataType
 from goofi.message import Message, MessageType
 from goofi.node_helpers import InputSlot, NodeRef, OutputSlot
@@ -107,6 +107,8 @@ class Node(ABC):
             # this is a separate process, run the messaging loop in the current thread
             # NOTE: if we don't block the current thread, the node's process will die
             self._messaging_loop()
+            # the process exits without running atexit handlers, unlink its shared memory segments explicitly
+            free_shared_memory(self.MESSAGE_TIMEOUT / 1000)
 
     @require_init
     def _validate_attrs(self):
@@ -246,11 +248,12 @@ class Node(ABC):
                 self._serialize()
             elif msg.type == MessageType.DATA:
                 # received data from another node
-                if msg.content["slot_name"] not in self.input_slots:
-                    raise ValueError(f"Received DATA message but input slot '{msg.content['slot_name']}' doesn't exist.")
-                slot = self.input_slots[msg.content["slot_name"]]
-                slot.data = msg.content["data"]
-                if slot.trigger_process:
+                if self._receive_data(msg):
+                    self.process_flag.set()
+            elif msg.type == MessageType.DATA_BATCH:
+                # received multiple data messages from another node, update all slots before triggering
+                triggers = [self._receive_data(data_msg) for data_msg in msg.content["messages"]]
+                if any(triggers):
                     self.process_flag.set()
             elif msg.type == MessageType.CLEAR_DATA:
                 # clear the data in the input slot (usually triggered by a REMOVE_OUTPUT_PIPE message)
@@ -298,6 +301,24 @@ class Node(ABC):
         # close input connection
         self.connection.close()
 
+    def _receive_data(self, msg: Message) -> bool:
+        """
+        Store the data of a DATA message in its target input slot.
+
+        ### Parameters
+        `msg` : Message
+            The DATA message.
+
+        ### Returns
+        `bool`
+            True if the input slot triggers processing.
+        """
+        if msg.content["slot_name"] not in self.input_slots:
+            raise ValueError(f"Received DATA message but input slot '{msg.content['slot_name']}' doesn't exist.")
+        slot = self.input_slots[msg.content["slot_name"]]
+        slot.data = msg.content["data"]
+        return slot.trigger_process
+
     def _processing_loop(self):
         """
         This method runs in a separate thread and handles the processing of input data and sending of
@@ -307,7 +328,9 @@ class Node(ABC):
         while not self._node_ready:
             time.sleep(0.1)
 
-        last_update = 0
+        next_deadline = 0
+        # reused across iterations, cleared before the outputs are gathered
+        batches = {}
         while self.alive:
             # wait for a trigger
             self.process_flag.wait()
@@ -315,12 +338,16 @@ class Node(ABC):
             if not self.params.common.autotrigger.value:
                 self.process_flag.clear()
 
-            # limit the update rate
+            # limit the update rate using absolute deadlines on the monotonic clock to avoid accumulating drift
             if self.params.common.max_frequency.value > 0:
-                sleep_time = 1 / self.params.common.max_frequency.value - (time.time() - last_update)
-                if sleep_time > 0:
-                    time.sleep(sleep_time)
-                last_update = time.time()
+                period_ns = int(1e9 / self.params.common.max_frequency.value)
+                now = time.monotonic_ns()
+                if now < next_deadline:
+                    time.sleep((next_deadline - now) / 1e9)
+                    next_deadline += period_ns
+                else:
+                    # we are behind schedule (or were idle), skip ahead instead of trying to catch up
+                    next_deadline = now + period_ns
 
             # gather input data
             input_data = {name: slot.data for name, slot in self.input_slots.items()}
@@ -350,7 +377,7 @@ class Node(ABC):
                 )
 
             # check that the output data contains the correct fields
-            if missing := set(self.output_slots.keys()) - set(output_data.keys()):
+            if missing := self.output_slots.keys() - output_data.keys():
                 self.connection.try_send(
                     Message(
                         MessageType.PROCESSING_ERROR,
@@ -364,7 +391,8 @@ class Node(ABC):
             # TODO: handle extra fields in output data
             # extra_fields = list(set(output_data.keys()) - set(self.output_slots.keys()))
 
-            # send output data
+            # gather output messages, grouped by their target connection
+            batches.clear()
             for name in self.output_slots.keys():
                 data = output_data[name]
                 try:
@@ -374,40 +402,41 @@ class Node(ABC):
                     self.connection.try_send(Message(MessageType.PROCESSING_ERROR, {"error": error_message}))
                     continue
 
-                # send the data to all connected nodes
                 for target_slot, conn, self_conn in self.output_slots[name].connections:
-                    try:
-                        msg = Message(MessageType.DATA, {"data": data, "slot_name": target_slot})
-                    except Exception:
-                        error_message = traceback.format_exc()
-                        self.connection.try_send(Message(MessageType.PROCESSING_ERROR, {"error": error_message}))
+                    # data was validated above and target_slot by the ADD_OUTPUT_PIPE message, skip validation
+                    msg = Message.unchecked(MessageType.DATA, {"data": data, "slot_name": target_slot})
+                    batches.setdefault(conn._id, (conn, []))[1].append((name, (target_slot, conn, self_conn), msg))
+
+            # send the data to all connected nodes
+            for conn_id, (conn, entries) in batches.items():
+                if conn_id in self.pending_connections:
+                    # filter out dead threads
+                    self.pending_connections[conn_id] = [
+                        (thread, timestamp) for thread, timestamp in self.pending_connections[conn_id] if thread.is_alive()
+                    ]
+                    # check if the connection has timed out
+                    if any(
+                        time.time() - creation > self.MESSAGE_TIMEOUT / 1000
+                        for _, creation in self.pending_connections[conn_id]
+                    ):
+                        # the connection has timed out, remove it and skip sending the messages
+                        # TODO: forward removal of this connection to the manager
+                        for name, connection, _ in entries:
+                            self.output_slots[name].connections.remove(connection)
                         continue
-
-                    if conn._id in self.pending_connections:
-                        # filter out dead threads
-                        self.pending_connections[conn._id] = [
-                            (thread, timestamp) for thread, timestamp in self.pending_connections[conn._id] if thread.is_alive()
-                        ]
-                        # check if the connection has timed out
-                        timeout_occurred = False
-                        for _, creation in self.pending_connections[conn._id]:
-                            if time.time() - creation > self.MESSAGE_TIMEOUT / 1000:
-                                # the connection has timed out, remove it
-                                # TODO: forward removal of this connection to the manager
-                                self.output_slots[name].connections.remove((target_slot, conn, self_conn))
-                                timeout_occurred = True
-                                continue
-
-                        if timeout_occurred:
-                            # skip sending the message if the connection has timed out
-                            continue
-                    else:
-                        self.pending_connections[conn._id] = []
-
-                    # send the message (in a separate thread because connections may time out and block)
-                    t = Thread(target=conn.send, args=(msg,), daemon=True)
-                    t.start()
-                    self.pending_connections[conn._id].append((t, time.time()))
+                else:
+                    self.pending_connections[conn_id] = []
+
+                if len(entries) == 1:
+                    msg = entries[0][2]
+                else:
+                    # bundle all messages to the same connection to pay the per-message transport cost only once
+                    msg = Message.unchecked(MessageType.DATA_BATCH, {"messages": [msg for _, _, msg in entries]})
+
+                # send the message (in a separate thread because connections may time out and block)
+                t = Thread(target=conn.send, args=(msg,), daemon=True)
+                t.start()
+                self.pending_connections[conn_id].append((t, time.time()))
 
     @staticmethod
     def _configure(cls) -> Tuple[Dict[str, InputSlot], Dict[str, OutputSlot], NodeParams]:
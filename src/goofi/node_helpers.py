@@ -10,7 +10,7 @@ from threading import Thread
 from typing import Any, Callable, Dict, List, Optional, Tuple, Type
 
 from goofi import nodes as goofi_nodes
-from goofi.connection import Connection
+from goofi.connection import Connection, SharedMemoryFreedError
 from goofi.data import Data, DataType
 from goofi.message import Message, MessageType
 from goofi.params import NodeParams
@@ -142,6 +142,7 @@ class NodeRef:
 
     - `PING`: Responds with a `PONG` message.
     - `TERMINATE`: Terminates the node by closing the connection to it.
+    - `DATA_BATCH`: Handles each of the bundled `DATA` messages individually.
 
     ### Parameters
     `connection` : Connection
@@ -257,29 +258,40 @@ class NodeRef:
                 self._alive = False
                 self.connection.close()
                 continue
+            except SharedMemoryFreedError:
+                # the node freed the shared memory of the message before it was received, drop the message
+                continue
 
             if not isinstance(msg, Message):
                 raise TypeError(f"Expected Message, got {type(msg)}")
 
-            # if the message type has a registered callback, call it and skip built-in message handling
-            if msg.type in self.callbacks:
-                try:
-                    self.callbacks[msg.type](self, msg)
-                except Exception:
-                    # TODO: add proper logging
-                    error_msg = traceback.format_exc()
-                    print(f"Message callback for {msg.type} failed: {error_msg}")
-                continue
+            self._handle_message(msg)
 
-            # built-in message handling
-            if msg.type == MessageType.PING:
-                # respond with PONG
-                self.connection.send(Message(MessageType.PONG, {}))
-            elif msg.type == MessageType.TERMINATE:
-                # the node has terminated itself, consider it dead
-                self._alive = False
-                self.connection.close()
-            elif msg.type == MessageType.SERIALIZE_RESPONSE:
-                # store the serialized state
-                self.serialized_state = msg.content
-                self.serialization_pending = False
+    def _handle_message(self, msg: Message) -> None:
+        """Handles a single message from the node, either with a registered callback or the built-in behavior."""
+        # if the message type has a registered callback, call it and skip built-in message handling
+        if msg.type in self.callbacks:
+            try:
+                self.callbacks[msg.type](self, msg)
+            except Exception:
+                # TODO: add proper logging
+                error_msg = traceback.format_exc()
+                print(f"Message callback for {msg.type} failed: {error_msg}")
+            return
+
+        # built-in message handling
+        if msg.type == MessageType.PING:
+            # respond with PONG
+            self.connection.send(Message(MessageType.PONG, {}))
+        elif msg.type == MessageType.TERMINATE:
+            # the node has terminated itself, consider it dead
+            self._alive = False
+            self.connection.close()
+        elif msg.type == MessageType.SERIALIZE_RESPONSE:
+            # store the serialized state
+            self.serialized_state = msg.content
+            self.serialization_pending = False
+        elif msg.type == MessageType.DATA_BATCH:
+            # unpack the bundled DATA messages and handle them individually
+            for data_msg in msg.content["messages"]:
+                self._handle_message(data_msg)
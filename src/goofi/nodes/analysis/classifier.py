@@ -46,6 +46,11 @@ class Classifier(Node):
                 "gamma": StringParam(
                     "scale", options=["scale", "auto"], doc="Kernel coefficient for ‘rbf’, ‘poly’ and ‘sigmoid’"
                 ),
+                "fast_proba": BoolParam(
+                    False,
+                    doc="Skip the cross-validated Platt scaling and map the decision function to probabilities "
+                    "with a logistic fit on the training set",
+                ),
             },
             "RandomForest": {
                 "n_estimators": IntParam(100, 10, 1000, doc="Number of trees in the forest"),
@@ -71,24 +76,29 @@ class Classifier(Node):
         self.KNeighborsClassifier = KNeighborsClassifier
         self.SVC = SVC
 
-        self.training_data = []
-        self.training_labels = []
+        self.clear_training_set()
         self.classifier = None
         self.classifier_trained = False
 
+        # outputs derived from the trained classifier, invalidated on retrain
+        self.feature_importances_cache = None
+        self.meta_cache = None
+
     def process(self, data: Data):
         if data is None:
             return None
+
+        # samples in the shape (n_samples, n_features), the training buffers cast them to float32 when they are added
+        X = data.data.T
+
         self.loadname = self.params.classification["loadname"].value
         self.savename = self.params.classification["savename"].value
         self.loadpath = join(self.assets_path, self.loadname)
         self.savepath = join(self.assets_path, self.savename)
 
         if self.params.classification.add_to_training.value:
-            transposed_data = data.data.T
-            self.training_data.extend(transposed_data)
-            self.training_labels.extend([self.params.classification.current_state.value] * transposed_data.shape[0])
-            self.classifier = None
+            self.add_training_samples(X, self.params.classification.current_state.value)
+            # keep the estimator around, it is refitted on the grown training set once train is triggered
             self.classifier_trained = False
             # print("Added to training set.")  # Debug statement
             return None
@@ -96,8 +106,8 @@ class Classifier(Node):
         if self.params.classification.load_data.value:
             try:
                 loaded_data = np.load(self.loadpath + ".npz")
-                self.training_data = loaded_data["training_data"].tolist()
-                self.training_labels = loaded_data["training_labels"].tolist()
+                self.clear_training_set()
+                self.add_training_samples(loaded_data["training_data"], loaded_data["training_labels"])
                 print(f"Loaded training data from {self.loadpath}.")  # Debug statement
             except Exception as e:
                 print(f"Error during loading data: {e}")  # Debug statement
@@ -108,65 +118,60 @@ class Classifier(Node):
 
         if self.params.classification.save_data.value:
             try:
-                np.savez(self.savepath, training_data=self.training_data, training_labels=self.training_labels)
+                np.savez(
+                    self.savepath,
+                    training_data=self.training_data[: self.n_training],
+                    training_labels=self.training_labels[: self.n_training],
+                )
                 print(f"Saved training data to {self.savepath}.")  # Debug statement
             except Exception as e:
                 print(f"Error during saving data: {e}")  # Debug statement
                 return None
 
         if self.params.classification.clear_training.value:
-            self.training_data = []
-            self.training_labels = []
+            self.clear_training_set()
             self.classifier = None
             self.classifier_trained = False
             print("Training set cleared.")
 
-        if self.params.classification.clear_training.value:
-            self.training_data = []
-            self.training_labels = []
-            self.classifier = None
-            self.classifier_trained = False
-            print("Training set cleared.")
-
-        if len(self.training_data) == 0:
+        if self.n_training == 0:
             print("No training data.")
             return None
 
         if self.classifier is None:
             classifier_choice = self.params.classification.classifier_choice.value
 
+            kwargs = self.classifier_kwargs()
+
             if classifier_choice == "NaiveBayes":
-                self.classifier = self.GaussianNB(var_smoothing=self.params.NaiveBayes.var_smoothing.value)
+                self.classifier = self.GaussianNB(**kwargs)
             elif classifier_choice == "SVM":
-                self.classifier = self.SVC(
-                    C=self.params.SVM.C.value,
-                    kernel=self.params.SVM.kernel.value,
-                    gamma=self.params.SVM.gamma.value,
-                    probability=True,
-                )
+                self.classifier = self.SVC(**kwargs)
             elif classifier_choice == "RandomForest":
-                self.classifier = self.RandomForestClassifier(
-                    n_estimators=self.params.RandomForest.n_estimators.value,
-                    max_depth=self.params.RandomForest.max_depth.value,
-                    min_samples_split=self.params.RandomForest.min_samples_split.value,
-                )
+                self.classifier = self.RandomForestClassifier(**kwargs)
             elif classifier_choice == "LogisticRegression":
-                self.classifier = self.LogisticRegression(C=self.params.LogisticRegression.C.value)
+                self.classifier = self.LogisticRegression(**kwargs)
             elif classifier_choice == "KNeighbors":
-                self.classifier = self.KNeighborsClassifier(n_neighbors=self.params.KNeighbors.n_neighbors.value)
+                self.classifier = self.KNeighborsClassifier(**kwargs)
 
         if self.params.classification.train.value:
             # check if there are enough samples for each class
-            for i in range(1, self.params.classification.n_states.value + 1):
-                if self.training_labels.count(i) < 2:
-                    print(f"Not enough samples for class {i} in training set.")
-                    return None
+            too_few = self.state_counts() < 2
+            if too_few.any():
+                print(f"Not enough samples for class {int(np.argmax(too_few)) + 1} in training set.")
+                return None
             try:
                 print(
-                    f"Training data shape: {len(self.training_data)} samples, {len(self.training_data[0]) if self.training_data else 0} features per sample."
+                    f"Training data shape: {self.n_training} samples, {self.training_data.shape[1]} features per sample."
                 )  # Debug statement
-                self.classifier.fit(self.training_data, self.training_labels)
+                # apply the current hyperparameters to the retained estimator before fitting
+                self.classifier.set_params(**self.classifier_kwargs())
+                self.classifier.fit(self.training_data[: self.n_training], self.training_labels[: self.n_training])
+                if isinstance(self.classifier, self.SVC) and not self.classifier.probability:
+                    self.fit_fast_proba()
                 self.classifier_trained = True
+                self.feature_importances_cache = None
+                self.meta_cache = None
             except Exception as e:
                 print(f"Error during fitting: {e}")  # Debug statement
 
@@ -175,26 +180,150 @@ class Classifier(Node):
             print("Classifier not trained.")
             return None
 
-        transposed_data = data.data.T
-        probs = self.classifier.predict_proba(transposed_data)
+        # libsvm validates the samples to float64, the other estimators accept the float32 of the training buffers
+        # without copying them again
+        X = np.ascontiguousarray(X, dtype=np.float64 if isinstance(self.classifier, self.SVC) else np.float32)
+        if isinstance(self.classifier, self.SVC) and not self.classifier.probability:
+            probs = self.fast_predict_proba(X)
+        else:
+            probs = self.classifier.predict_proba(X)
+
+        if self.meta_cache is None:
+            # After the classifier has been trained
+            self.feature_importances_cache = np.array(self.get_feature_importances())
 
-        # After the classifier has been trained
-        feature_importances = self.get_feature_importances()
-        # if feature_importances is not None:
-        # print("Feature Importances:", feature_importances)
+            # create metadata including the classifier, the size of the training set for each class, and the number of features
+            self.meta_cache = {"classifier": self.params.classification.classifier_choice.value}
+            for i, count in enumerate(self.state_counts().tolist(), start=1):
+                self.meta_cache[f"training_set_size_{i}"] = count
+            self.meta_cache["n_features"] = self.training_data.shape[1]
 
-        # create metadata including the classifier, the size of the training set for each class, and the number of features
-        meta = {"classifier": self.params.classification.classifier_choice.value}
-        for i in range(1, self.params.classification.n_states.value + 1):
-            meta[f"training_set_size_{i}"] = self.training_labels.count(i)
-        meta["n_features"] = len(self.training_data[0]) if self.training_data else 0
+        # copy the cached metadata as the outgoing Data object populates its meta dict
+        meta = dict(self.meta_cache)
         meta_features = {}
         if "channels" in data.meta:
             meta_features["channels"] = data.meta["channels"]
         if "sfreq" in data.meta:
             meta["sfreq"] = data.meta["sfreq"]
             meta_features["sfreq"] = data.meta["sfreq"]
-        return {"probs": (probs, meta), "feature_importances": (np.array(feature_importances), meta_features)}
+        return {"probs": (probs, meta), "feature_importances": (self.feature_importances_cache, meta_features)}
+
+    def classification_classifier_choice_changed(self, value):
+        """Discard the current estimator so the newly selected algorithm is instantiated."""
+        self.classifier = None
+        self.classifier_trained = False
+        self.meta_cache = None
+
+    def classification_n_states_changed(self, value):
+        """Rebuild the metadata, which lists the training set size of each state."""
+        self.meta_cache = None
+
+    def classifier_kwargs(self):
+        """Return the hyperparameters of the selected classifier as keyword arguments."""
+        classifier_choice = self.params.classification.classifier_choice.value
+        if classifier_choice == "NaiveBayes":
+            return {"var_smoothing": self.params.NaiveBayes.var_smoothing.value}
+        elif classifier_choice == "SVM":
+            return {
+                "C": self.params.SVM.C.value,
+                "kernel": self.params.SVM.kernel.value,
+                "gamma": self.params.SVM.gamma.value,
+                "probability": not self.params.SVM.fast_proba.value,
+            }
+        elif classifier_choice == "RandomForest":
+            return {
+                "n_estimators": self.params.RandomForest.n_estimators.value,
+                "max_depth": self.params.RandomForest.max_depth.value,
+                "min_samples_split": self.params.RandomForest.min_samples_split.value,
+            }
+        elif classifier_choice == "LogisticRegression":
+            return {"C": self.params.LogisticRegression.C.value}
+        elif classifier_choice == "KNeighbors":
+            return {"n_neighbors": self.params.KNeighbors.n_neighbors.value}
+        return {}
+
+    def clear_training_set(self):
+        """Reset the training buffers. The buffers are allocated lazily once the number of features is known."""
+        self.training_data = np.empty((0, 0), dtype=np.float32)
+        self.training_labels = np.empty(0, dtype=np.int32)
+        self.class_counts = np.zeros(self.params.classification.n_states.value + 1, dtype=np.int64)
+        self.n_training = 0
+
+    def add_training_samples(self, samples: np.ndarray, labels):
+        """
+        Append samples to the preallocated training buffers, doubling their capacity when they are full.
+
+        ### Parameters
+        `samples` : np.ndarray
+            The new samples in the shape (n_samples, n_features).
+        `labels` : int or np.ndarray
+            A single label for all samples, or one label per sample.
+        """
+        samples = np.atleast_2d(samples)
+        k, n_features = samples.shape
+        if self.n_training == 0 and self.training_data.shape[1] != n_features:
+            self.training_data = np.empty((max(1024, k), n_features), dtype=np.float32)
+            self.training_labels = np.empty(max(1024, k), dtype=np.int32)
+        elif self.training_data.shape[1] != n_features:
+            raise ValueError(f"Expected {self.training_data.shape[1]} features, got {n_features}.")
+
+        end = self.n_training + k
+        if end > len(self.training_labels):
+            # grow the buffers by doubling their capacity
+            capacity = max(end, 2 * len(self.training_labels))
+            training_data = np.empty((capacity, n_features), dtype=np.float32)
+            training_data[: self.n_training] = self.training_data[: self.n_training]
+            training_labels = np.empty(capacity, dtype=np.int32)
+            training_labels[: self.n_training] = self.training_labels[: self.n_training]
+            self.training_data, self.training_labels = training_data, training_labels
+
+        self.training_data[self.n_training : end] = samples
+        self.training_labels[self.n_training : end] = labels
+
+        # update the class counts incrementally
+        counts = np.bincount(self.training_labels[self.n_training : end], minlength=len(self.class_counts))
+        if len(counts) > len(self.class_counts):
+            self.class_counts = np.pad(self.class_counts, (0, len(counts) - len(self.class_counts)))
+        self.class_counts += counts
+        self.n_training = end
+
+    def state_counts(self) -> np.ndarray:
+        """Return the number of training samples for each of the states 1 to n_states."""
+        n_states = self.params.classification.n_states.value
+        counts = self.class_counts[1 : n_states + 1]
+        if len(counts) < n_states:
+            counts = np.pad(counts, (0, n_states - len(counts)))
+        return counts
+
+    def fit_fast_proba(self):
+        """Fit a logistic map from the decision function of the trained SVM to class probabilities."""
+        X, y = self.training_data[: self.n_training], self.training_labels[: self.n_training]
+        scores = self.classifier.decision_function(X).reshape(len(X), -1)
+        calibration = self.LogisticRegression().fit(scores, y)
+        self.proba_coef = calibration.coef_.T
+        self.proba_intercept = calibration.intercept_
+
+    def fast_predict_proba(self, X: np.ndarray) -> np.ndarray:
+        """
+        Compute class probabilities from the decision function using the logistic map from `fit_fast_proba`.
+
+        ### Parameters
+        `X` : np.ndarray
+            The samples in the shape (n_samples, n_features).
+
+        ### Returns
+        `np.ndarray`
+            The class probabilities in the shape (n_samples, n_classes).
+        """
+        logits = self.classifier.decision_function(X).reshape(len(X), -1) @ self.proba_coef + self.proba_intercept
+        if logits.shape[1] == 1:
+            # binary problem, a single sigmoid gives the probability of the second class
+            p = 1.0 / (1.0 + np.exp(-logits[:, 0]))
+            return np.stack([1.0 - p, p], axis=1)
+        # multiclass problem, softmax over the one-vs-rest scores
+        logits -= logits.max(axis=1, keepdims=True)
+        np.exp(logits, out=logits)
+        return logits / logits.sum(axis=1, keepdims=True)
 
     def get_feature_importances(self):
         """Retrieve feature importances from the classifier."""
@@ -21,9 +21,16 @@ class LempelZiv(Node):
         }
 
     def setup(self):
-        from antropy import lziv_complexity
+        try:
+            import numba
+        except ImportError:
+            from antropy import lziv_complexity
 
-        self.compute_lzc = lziv_complexity
+            # fall back to computing the complexity one row at a time
+            self.compute_lzc = lambda rows: np.array([lziv_complexity(row, normalize=True) for row in rows])
+            return
+
+        self.compute_lzc = numba.njit(cache=True)(lz_complexity_rows)
 
     def process(self, data: Data):
         if data is None:
@@ -40,10 +47,58 @@ class LempelZiv(Node):
         elif binarize_mode == "median":
             binarized = data.data > np.median(data.data, axis=axis, keepdims=True)  # median split
 
+        # flatten all other dimensions so the complexity is computed for all rows in a single call
+        binarized = np.moveaxis(binarized, axis, -1)
+        rows = np.ascontiguousarray(binarized.reshape(-1, binarized.shape[-1]), dtype=np.uint8)
+
         # compute Lempel-Ziv complexity
-        lzc = np.apply_along_axis(self.compute_lzc, axis, binarized, normalize=True)
-        #                         ^^^^^^^^^^^^^^^^  ^^^^   ^^^^^^^^^  ^^^^^^^^^^^^^^
-        #                         fn to apply       axis   data       args to fn
+        lzc = self.compute_lzc(rows).reshape(binarized.shape[:-1])
 
         # return Lempel-Ziv complexity and incoming metadata
         return {"lzc": (lzc, data.meta)}
+
+
+def lz_complexity_rows(rows: np.ndarray) -> np.ndarray:
+    """
+    Compute the normalized Lempel-Ziv (LZ76) complexity of each row of a 2D binary array. This function is
+    compiled with numba in `LempelZiv.setup()`, and matches `antropy.lziv_complexity(row, normalize=True)`.
+
+    ### Parameters
+    `rows` : np.ndarray
+        A 2D array of binary sequences with shape (n_rows, n_samples).
+
+    ### Returns
+    `np.ndarray`
+        The normalized complexity for each row.
+    """
+    n_rows, n = rows.shape
+    out = np.empty(n_rows)
+    for r in range(n_rows):
+        seq = rows[r]
+        complexity = 1
+        prefix_len = 1
+        len_substring = 1
+        max_len_substring = 1
+        pointer = 0
+
+        while prefix_len + len_substring <= n:
+            if seq[pointer + len_substring - 1] == seq[prefix_len + len_substring - 1]:
+                len_substring += 1
+            else:
+                max_len_substring = max(len_substring, max_len_substring)
+                pointer += 1
+                if pointer == prefix_len:
+                    # all pointers have been scanned, jump by the longest substring
+                    complexity += 1
+                    prefix_len += max_len_substring
+                    pointer = 0
+                    max_len_substring = 1
+                len_substring = 1
+
+        # the final iteration ended in the middle of a substring
+        if len_substring != 1:
+            complexity += 1
+
+        # binary sequences always use base 2 for normalization
+        out[r] = complexity / (n / np.log2(n))
+    return out
@@ -5,6 +5,15 @@ import numpy as np
 
 
 class PowerBandEEG(Node):
+    BANDS = {
+        "delta": (1, 3),
+        "theta": (3, 7),
+        "alpha": (7, 12),
+        "lowbeta": (12, 20),
+        "highbeta": (20, 30),
+        "gamma": (30, 50),
+    }
+
     def config_input_slots():
         return {"data": DataType.ARRAY}
 
@@ -28,14 +37,6 @@ class PowerBandEEG(Node):
     def process(self, data: Data):
         if data is None or data.data is None:
             return None
-        bands = {
-            "delta": (1, 3),
-            "theta": (3, 7),
-            "alpha": (7, 12),
-            "lowbeta": (12, 20),
-            "highbeta": (20, 30),
-            "gamma": (30, 50),
-        }
         power_type = self.params["powerband"]["power_type"].value
         if data.data.ndim == 1:
             freqs = np.array(data.meta["channels"]["dim0"])
@@ -48,18 +49,18 @@ class PowerBandEEG(Node):
                 freqs[0] = 1e-8
             del data.meta["channels"]["dim1"]
 
-        output = {}
-        for band, (f_min, f_max) in bands.items():
-            valid_indices = np.where((freqs >= f_min) & (freqs <= f_max))[0]
-            if data.data.ndim == 1:
-                selected_psd = data.data[valid_indices]
-            else:  # if 2D
-                selected_psd = data.data[:, valid_indices]
+        if power_type == "relative":
+            total_power = np.sum(data.data, axis=-1)
 
+        # the frequency axis is sorted, so each band is a contiguous slice of the spectrum
+        lows = np.searchsorted(freqs, [f_min for f_min, _ in self.BANDS.values()], side="left")
+        highs = np.searchsorted(freqs, [f_max for _, f_max in self.BANDS.values()], side="right")
+
+        output = {}
+        for (band, (f_min, f_max)), lo, hi in zip(self.BANDS.items(), lows, highs):
             # Computing the power
-            power = np.sum(selected_psd, axis=-1)
+            power = np.sum(data.data[..., lo:hi], axis=-1)
             if power_type == "relative":
-                total_power = np.sum(data.data, axis=-1)
                 power = power / total_power
 
             output[band] = (np.array(power), {"freq_min": f_min, "freq_max": f_max, **data.meta})
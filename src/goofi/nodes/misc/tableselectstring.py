@@ -1,3 +1,5 @@
+from operator import itemgetter
+
 from goofi.data import DataType, Data
 from goofi.node import Node
 from goofi.params import StringParam
@@ -16,20 +18,29 @@ class TableSelectString(Node):
             "common": {"autotrigger": False},
         }
 
+    def setup(self):
+        # keep a reference to the parameter object, its value is updated in place
+        self.key_param = self.params["selection"]["key"]
+        # accessor specialized to the selected key, rebuilt when the key changes
+        self.select_key = self.key_param.value
+        self.select = itemgetter(self.select_key)
+
     def process(self, input_table: Data):
         if input_table is None:
             return None
 
         # Retrieve the selected key
-        selected_key = self.params["selection"]["key"].value
-
-        if selected_key not in input_table.data:
+        selected_key = self.key_param.value
+        if selected_key != self.select_key:
+            self.select_key = selected_key
+            self.select = itemgetter(selected_key)
+
+        try:
+            selected_value = self.select(input_table.data)
+        except KeyError:
             raise KeyError(f"{selected_key} not found in the input table.")
 
-        selected_value = input_table.data[selected_key]
-        # print(selected_value)
-        # print(type(selected_value))
-        if selected_value.dtype != DataType.STRING:
+        if selected_value.dtype is not DataType.STRING:
             raise ValueError(f"The value for {selected_key} is not a string.")
 
         return {"output_string": (selected_value.data, input_table.meta)}
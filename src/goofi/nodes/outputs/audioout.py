@@ -1,8 +1,10 @@
+import functools
+
 import numpy as np
 
 from goofi.data import Data, DataType
 from goofi.node import Node
-from goofi.params import StringParam
+from goofi.params import BoolParam, StringParam
 
 
 class AudioOut(Node):
@@ -10,11 +12,14 @@ class AudioOut(Node):
         return {"data": DataType.ARRAY}
 
     def config_params():
+        # config_params runs in the manager whenever a node is created, enumerate the devices again for each new node
+        AudioOut.list_audio_devices.cache_clear()
         return {
             "audio": {
                 "sampling_rate": StringParam("44100", options=["44100", "48000", "32000", "16000"]),
                 "device": StringParam(AudioOut.list_audio_devices()[0], options=AudioOut.list_audio_devices()),
                 "transition_samples": 100,
+                "rescan_devices": BoolParam(False, trigger=True, doc="Update the list of available audio devices"),
             }
         }
 
@@ -25,13 +30,19 @@ class AudioOut(Node):
             self.stream.stop()
             self.stream.close()
 
+        # parse the sampling rate option once, it is only updated through audio_sampling_rate_changed
+        self.sampling_rate = int(self.params.audio.sampling_rate.value)
+
         self.stream = sd.OutputStream(
-            samplerate=int(self.params.audio.sampling_rate.value),
+            samplerate=self.sampling_rate,
             device=self.params.audio.device.value,
         )
         self.stream.start()
 
         self.last_sample = None
+        # output buffer reused for every block, grown when a larger block arrives
+        self.out_buffer = np.empty((0, 0), dtype=np.float32)
+        self.audio_transition_samples_changed(self.params.audio.transition_samples.value)
 
     def process(self, data: Data):
         if data is None:
@@ -40,37 +51,55 @@ class AudioOut(Node):
         if self.stream is None:
             raise RuntimeError("Audio output stream is not available.")
 
-        # set data type to float32
-        samples = data.data.astype(np.float32).T
+        # frames in the shape (n_samples, n_channels), as a view of the input
+        frames = data.data.T
         # Handle Mono to Stereo or Stereo to Mono Conversion
         # Verify that the samples array has the correct number of dimensions
-        if samples.data.ndim == 1:
-            # Mono audio: duplicate the channel for stereo output
-            samples = np.stack((samples.data, samples.data), axis=-1)
-        elif samples.data.ndim == 2 and samples.data.shape[1] == 1:
-            # Also handle the case where the array is 2D but has only one channel
-            samples = np.concatenate((samples.data, samples.data), axis=1)
-        else:
-            # For already stereo or multi-channel data, use as is
-            samples = samples.data
+        if frames.ndim == 1:
+            frames = frames[:, None]
+        # Mono audio (1D, or 2D with only one channel): the channel is duplicated for stereo output when copying
+        n_channels = 2 if frames.shape[1] == 1 else frames.shape[1]
+
+        # read the ramp once, audio_transition_samples_changed may replace it from the messaging thread at any time
+        ramp = self.ramp
+        n_transition = len(ramp)
+        n_total = n_transition + frames.shape[0]
+        if self.out_buffer.shape[0] < n_total or self.out_buffer.shape[1] != n_channels:
+            self.out_buffer = np.empty((n_total, n_channels), dtype=np.float32)
+
+        # the leading rows of the buffer are C-contiguous, cast, transpose and duplicate mono input in a single copy
+        # into the rows after the transition
+        out = self.out_buffer[:n_total]
+        np.copyto(out[n_transition:], frames)
 
         if self.last_sample is None:
-            self.last_sample = samples[-1]
+            self.last_sample = out[-1].copy()
 
-        transition = np.linspace(self.last_sample, samples[0], num=self.params.audio.transition_samples.value)
-        samples = np.concatenate((transition, samples), axis=0)
+        # interpolate from the last sample of the previous block to the first sample of this block
+        transition = out[:n_transition]
+        np.subtract(out[n_transition], self.last_sample, out=transition)
+        transition *= ramp
+        transition += self.last_sample
 
-        self.last_sample = samples[-1]
+        # copy the last sample as the buffer is overwritten by the next block
+        self.last_sample = out[-1].copy()
 
-        # Send the audio data to the output device after ensuring it's C-contiguous
-        self.stream.write(np.ascontiguousarray(samples))
+        # Send the audio data to the output device
+        self.stream.write(out)
+
+    def audio_transition_samples_changed(self, value):
+        """Precompute the interpolation weights of the transition between consecutive blocks."""
+        # exclude both endpoints, which would repeat the last sample of the previous and the first of the next block
+        n = max(value, 0)
+        self.ramp = (np.arange(1, n + 1, dtype=np.float32) / np.float32(n + 1))[:, None]
 
     def audio_sampling_rate_changed(self, value):
         self.setup()
 
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def list_audio_devices():
-        """Returns a list of available audio devices."""
+        """Returns a list of available audio devices. The result is cached until the cache is cleared."""
         import sounddevice as sd
 
         if sd is None:
@@ -86,3 +115,10 @@ class AudioOut(Node):
 
     def audio_device_changed(self, value):
         self.setup()
+
+    def audio_rescan_devices_changed(self, value):
+        """Query the audio devices again and update the device options."""
+        AudioOut.list_audio_devices.cache_clear()
+        self.params.audio.device.options = AudioOut.list_audio_devices()
+        # the parameters were serialized before this callback ran, send the new options to the manager
+        self._serialize()
@@ -1,5 +1,5 @@
 import numpy as np
-from numpy.fft import fft, fftfreq
+from scipy.fft import next_fast_len, rfft, rfftfreq, set_backend, set_workers
 from scipy.signal import welch
 
 # from mne.time_frequency import tfr_array_multitaper
@@ -24,11 +24,30 @@ class PSD(Node):
                 "f_min": FloatParam(1.0, 0.01, 9999.0),
                 "f_max": FloatParam(60.0, 1.0, 10000.0),
                 "smooth_welch": IntParam(1, 1, 10),
+                "detrend": StringParam(
+                    "constant",
+                    options=["constant", "linear", "none"],
+                    doc="Detrending applied to each welch segment, none skips a pass over every segment",
+                ),
+                "fft_backend": StringParam(
+                    "scipy", options=["scipy", "pyfftw"], doc="FFT implementation, pyfftw requires the pyfftw package"
+                ),
+                "dtype": StringParam(
+                    "float32", options=["float32", "float64"], doc="Floating point precision of the computation"
+                ),
                 # "time_bandwidth_multitaper": FloatParam(2.0, 0.1, 10.0),
                 # "n_cycles_multitaper": IntParam(7, 1, 20),
             }
         }
 
+    def setup(self):
+        # segment and FFT lengths for the last sampling rate, reset when precision or smooth_welch change
+        self.segment_cache = None
+        # frequency axis parameters, and the selected band and frequencies derived from them
+        self.freq_cache = None
+
+        self.psd_fft_backend_changed(self.params["psd"]["fft_backend"].value)
+
     def process(self, data: Data):
         if data is None or data.data is None:
             return None
@@ -38,38 +57,46 @@ class PSD(Node):
 
         method = self.params["psd"]["method"].value
         noverlap = self.params["psd"]["noverlap"].value
-        precision = self.params["psd"]["precision"].value
+        detrend = self.params["psd"]["detrend"].value
         f_min = self.params["psd"]["f_min"].value  # Get the min frequency
         f_max = self.params["psd"]["f_max"].value  # Get the max frequency
-        smooth = self.params["psd"]["smooth_welch"].value
         # time_bandwidth = self.params["psd"]["time_bandwidth_multitaper"].value
         # n_cycles = self.params["psd"]["n_cycles_multitaper"].value
 
-        sfreq = data.meta["sfreq"]
-        nperseg = int(sfreq / precision)
-        nfft = nperseg / smooth
+        # single precision transforms are faster, the signal is only copied if it has a different dtype
+        # (non-contiguous input is not copied either, scipy.fft buffers strided rows itself, which is faster than
+        # making the whole array contiguous first)
+        x = data.data.astype(self.params["psd"]["dtype"].value, copy=False)
 
-        # Sanity check for recommended parameters
-        if data.data.shape[-1] < f_min * 3 * sfreq:
-            print(
-                "Warning: The minimum frequency is too low for the length of the signal. "
-                "Consider increasing the minimum frequency or increasing the signal length."
-            )
+        sfreq = data.meta["sfreq"]
+        # read the cache once, parameter callbacks may reset it from the messaging thread at any time
+        segment_cache = self.segment_cache
+        if segment_cache is None or segment_cache[0] != sfreq:
+            nperseg = int(sfreq / self.params["psd"]["precision"].value)
+            # round the FFT length up to a length with small prime factors, which has the fastest transforms
+            nfft = next_fast_len(int(nperseg // self.params["psd"]["smooth_welch"].value), real=True)
+            segment_cache = (sfreq, nperseg, nfft)
+            self.segment_cache = segment_cache
+        _, nperseg, nfft = segment_cache
 
         if method == "fft":
-            freq = fftfreq(data.data.shape[-1], 1 / sfreq)
-            fft_result = fft(data.data, axis=-1)
-            psd = np.abs(fft_result)
+            # the input is real, so only compute the non-negative half of the spectrum, parallelized over channels
+            # zero-pad the signal to the next length with small prime factors
+            n_fft = next_fast_len(x.shape[-1], real=True)
+            with set_backend(self.fft_backend):
+                fft_result = rfft(x, n=n_fft, axis=-1, workers=-1)
         elif method == "welch":
-            if data.data.ndim == 1:
-                freq, psd = welch(data.data, fs=sfreq, nperseg=nperseg, nfft=nfft, noverlap=noverlap)
-            else:  # if 2D
-                psd = []
-                for row in data.data:
-                    f, p = welch(row, fs=sfreq, nperseg=nperseg, nfft=nfft, noverlap=noverlap)
-                    psd.append(p)
-                freq = f
-                psd = np.array(psd)
+            # welch uses scipy.fft internally, let it use all available workers and transform all channels at once
+            with set_backend(self.fft_backend), set_workers(-1):
+                freq, psd = welch(
+                    x,
+                    fs=sfreq,
+                    nperseg=nperseg,
+                    nfft=nfft,
+                    noverlap=noverlap,
+                    detrend=False if detrend == "none" else detrend,
+                    axis=-1,
+                )
         """elif method == "multitaper":
             fmin, fmax = f_min, f_max       
             # Computing the TFR using multitaper
@@ -87,17 +114,65 @@ class PSD(Node):
             psd = psd.squeeze()
             freq = np.arange(fmin, fmax, precision)"""
 
-        # prepare metadata
-        meta = data.meta.copy()
+        # Selecting the range of frequencies, only recomputed when the frequency axis or the range changes
+        freq_key = (method, sfreq, data.data.shape[-1], nperseg, nfft, f_min, f_max)
+        if self.freq_cache is None or self.freq_cache[0] != freq_key:
+            # Sanity check for recommended parameters, only repeated when the parameters change
+            if data.data.shape[-1] < f_min * 3 * sfreq:
+                print(
+                    "Warning: The minimum frequency is too low for the length of the signal. "
+                    "Consider increasing the minimum frequency or increasing the signal length."
+                )
+
+            if method == "fft":
+                freq = rfftfreq(n_fft, 1 / sfreq)
+            # the frequencies are sorted, so the selected range is a contiguous band
+            lo = int(np.searchsorted(freq, f_min, side="left"))
+            # an empty band if f_min is above f_max
+            hi = max(int(np.searchsorted(freq, f_max, side="right")), lo)
+            band = slice(lo, hi)
+            self.freq_cache = (freq_key, band, freq[band].tolist())
+        _, band, freq_list = self.freq_cache
 
-        # Selecting the range of frequencies
-        valid_indices = np.where((freq >= f_min) & (freq <= f_max))[0]
-        freq = freq[valid_indices]
-        if data.data.ndim == 1:
-            psd = psd[valid_indices]
-            meta["channels"]["dim0"] = freq.tolist()
-        else:  # if 2D
-            psd = psd[:, valid_indices]
-            meta["channels"]["dim1"] = freq.tolist()
+        if method == "fft":
+            # only compute the magnitude of the selected frequencies
+            psd = np.abs(fft_result[..., band])
+        else:
+            # slicing the last axis returns a view instead of copying the selected frequencies
+            psd = psd[..., band]
+        # NOTE: psd is always a new array (or a view of one). Output arrays must not be reused between calls because
+        # they are serialized asynchronously by the node's sender threads, which may still be running when the next
+        # call would overwrite a reused buffer.
+
+        # share the incoming metadata and only copy the channels dict, which gets the cached frequency list
+        meta = dict(data.meta)
+        meta["channels"] = {**data.meta["channels"], f"dim{data.data.ndim - 1}": freq_list}
 
         return {"psd": (psd, meta)}
+
+    def psd_fft_backend_changed(self, value):
+        """Select the FFT implementation, which is only used for this node's transforms."""
+        if value == "pyfftw":
+            try:
+                import pyfftw
+            except ImportError:
+                # fall back to scipy and show it in the parameter, the error is reported once by the caller and a
+                # repeated setup() succeeds with the reset parameter
+                self.fft_backend = "scipy"
+                self.params["psd"]["fft_backend"].value = "scipy"
+                self._serialize()
+                raise ImportError("pyfftw is not installed, using the scipy FFT backend: pip install pyfftw")
+
+            # keep the FFTW plans of repeated shapes around
+            pyfftw.interfaces.cache.enable()
+            self.fft_backend = pyfftw.interfaces.scipy_fft
+        else:
+            self.fft_backend = "scipy"
+
+    def psd_precision_changed(self, value):
+        """Recompute the segment length with the new precision."""
+        self.segment_cache = None
+
+    def psd_smooth_welch_changed(self, value):
+        """Recompute the FFT length with the new smoothing factor."""
+        self.segment_cache = None
@@ -27,6 +27,8 @@ class StaticBaseline(Node):
     def setup(self):
         self.window = []
         self.time_origin = None
+        # mean and std of the baseline window, recomputed only when the window changes
+        self.window_stats = None
 
     def process(self, data: Data):
         if data is None or data.data is None:
@@ -42,6 +44,7 @@ class StaticBaseline(Node):
         # If baseline computation is triggered, reset the window and set time_origin
         if self.params["baseline"]["baseline_computation"].value:
             self.window = []
+            self.window_stats = None
             self.time_origin = time.time()
 
         if self.time_origin:
@@ -49,6 +52,7 @@ class StaticBaseline(Node):
 
             if elapsed_time < self.params["baseline"]["n_seconds"].value:
                 self.window.extend(val)
+                self.window_stats = None
             else:
                 self.time_origin = None  # Reset time_origin after accumulating for n_seconds
 
@@ -65,17 +69,20 @@ class StaticBaseline(Node):
         return {"normalized": (normalized_value, data.meta)}
 
     def zscore(self, val):
-        if val.ndim == 1:
-            mean = np.mean(self.window)
-            std = np.std(self.window)
-            return (val - mean) / (std + 1e-8)
-        elif val.ndim == 2:
-            normalized = np.zeros_like(val)
-            for i in range(val.shape[0]):
-                mean = np.mean(self.window[i])
-                std = np.std(self.window[i])
-                normalized[i, :] = (val[i, :] - mean) / (std + 1e-8)
-            return normalized
+        key = (val.shape[:-1], val.dtype)
+        if self.window_stats is None or self.window_stats[0] != key:
+            # the baseline window changed, update the cached statistics
+            if val.ndim == 1:
+                mean, std = np.mean(self.window), np.std(self.window)
+            else:
+                mean = np.array([np.mean(self.window[i]) for i in range(val.shape[0])])[:, None]
+                std = np.array([np.std(self.window[i]) for i in range(val.shape[0])])[:, None]
+            # store the statistics in the dtype of floating point input so the output keeps the input dtype
+            dtype = val.dtype if np.issubdtype(val.dtype, np.floating) else np.float64
+            self.window_stats = (key, np.asarray(mean, dtype=dtype), np.asarray(std + 1e-8, dtype=dtype))
+
+        _, mean, std = self.window_stats
+        return (val - mean) / std
 
     def quantile_transform(self, val):
         # Check for dimension
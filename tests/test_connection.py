@@ -1,10 +1,19 @@
+import os
 import time
 from multiprocessing import Manager as MPManager
 from multiprocessing import Process
 
+import numpy as np
 import pytest
 
-from goofi.connection import Connection
+from goofi.connection import (
+    SHARED_MEMORY_THRESHOLD,
+    Connection,
+    SharedArrayPool,
+    SharedMemoryFreedError,
+    free_shared_memory,
+)
+from goofi.data import Data, DataType
 from goofi.message import Message, MessageType
 
 
@@ -130,3 +139,100 @@ def test_multiproc(backend):
 
     assert conn2.recv() == 1, "Connection.send() and Connection.recv() didn't work"
     p.join()
+
+
+def _shared_memory_segments():
+    if not os.path.isdir("/dev/shm"):
+        # segments are not listed as files on this platform
+        return set()
+    return {name for name in os.listdir("/dev/shm") if name.startswith("psm_")}
+
+
+def _send_large_data(conn):
+    try:
+        conn.send(Data(DataType.ARRAY, np.arange(SHARED_MEMORY_THRESHOLD, dtype=np.float64), {"sfreq": 1.0}))
+    finally:
+        # wait for the other process to receive the message, and free the segment as node processes do
+        free_shared_memory(timeout=1.0)
+
+
+def _send_freed_data(conn):
+    conn.send(Data(DataType.ARRAY, np.arange(SHARED_MEMORY_THRESHOLD, dtype=np.float64), {"sfreq": 1.0}))
+    # free the segment before the other process received the message
+    free_shared_memory()
+    conn.send(1)
+
+
+def test_send_large_array():
+    try:
+        mp_manager = MPManager()
+        Connection.set_backend("mp", mp_manager)
+    except AssertionError:
+        # connection backend is already set
+        pass
+
+    conn1, conn2 = Connection.create()
+    expected = np.arange(SHARED_MEMORY_THRESHOLD, dtype=np.float64)
+
+    # send multiple arrays within the same process, reusing shared memory segments
+    for _ in range(10):
+        conn1.send(Data(DataType.ARRAY, expected, {"sfreq": 1.0}))
+        data = conn2.recv()
+        assert np.array_equal(data.data, expected), "Large array was corrupted during transfer."
+        assert data.meta["sfreq"] == 1.0, "Metadata was corrupted during transfer."
+
+    # send an array from another process
+    segments = _shared_memory_segments()
+    p = Process(target=_send_large_data, args=(conn1,))
+    p.start()
+    assert np.array_equal(conn2.recv().data, expected), "Large array was corrupted during transfer."
+    p.join()
+    assert _shared_memory_segments() == segments, "The sending process left shared memory segments behind."
+
+    conn1.close()
+    conn2.close()
+
+
+def test_shared_array_pool_bounded():
+    pool = SharedArrayPool()
+    pool.MAX_POOL_BYTES = 384 * 1024
+
+    try:
+        # a stream with a new array size every frame
+        for nbytes in range(10000, 200000, 1000):
+            shm = pool.acquire(nbytes)
+            assert shm is not None, "Pool should provide a segment for every frame."
+            assert pool.total_bytes <= pool.MAX_POOL_BYTES, "Pool grew beyond its size limit."
+            # mark the segment as received
+            shm.buf[0] = 0
+
+        # old sizes are evicted once the pool is full
+        assert sum(len(segments) for segments in pool.segments.values()) <= 2, "Pool should evict unused segments."
+        assert pool.acquire(pool.MAX_POOL_BYTES) is None, "Arrays larger than the pool should not use shared memory."
+    finally:
+        pool.close()
+
+    assert len(pool.segments) == 0 and pool.total_bytes == 0, "Closing the pool should free all segments."
+    assert pool.acquire(20000) is None, "A closed pool should not hand out segments."
+
+
+def test_recv_freed_shared_memory():
+    try:
+        mp_manager = MPManager()
+        Connection.set_backend("mp", mp_manager)
+    except AssertionError:
+        # connection backend is already set
+        pass
+
+    conn1, conn2 = Connection.create()
+
+    p = Process(target=_send_freed_data, args=(conn1,))
+    p.start()
+    p.join()
+
+    with pytest.raises(SharedMemoryFreedError):
+        conn2.recv()
+    assert conn2.recv() == 1, "The connection should remain usable after a message with freed shared memory."
+
+    conn1.close()
+    conn2.close()
@@ -25,6 +25,9 @@ EXAMPLE_CONTENT = {
         "node_connection": Connection.create()[0],
     },
     MessageType.DATA: {"slot_name": "test", "data": Data(DataType.STRING, "", {})},
+    MessageType.DATA_BATCH: {
+        "messages": [Message(MessageType.DATA, {"slot_name": "test", "data": Data(DataType.STRING, "", {})})]
+    },
     MessageType.CLEAR_DATA: {"slot_name": "test"},
     MessageType.PING: {},
     MessageType.PONG: {},
@@ -74,3 +77,16 @@ def test_message_errors(type):
     # content is None
     with pytest.raises(ValueError):
         Message(type, None)
+
+
+@pytest.mark.parametrize("type", MessageType.__members__.values())
+def test_unchecked_message(type):
+    if type not in EXAMPLE_CONTENT:
+        # EXAMPLE_CONTENT is missing a test for this type
+        raise NotImplementedError(f"Missing test for {type}.")
+
+    msg = Message.unchecked(type, EXAMPLE_CONTENT[type])
+    assert msg == Message(type, EXAMPLE_CONTENT[type]), "Unchecked message differs from a validated message."
+
+    # unchecked messages skip validation
+    Message.unchecked(type, {})
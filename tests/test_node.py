@@ -230,6 +230,42 @@ def test_pipes():
     ref2.terminate()
 
 
+def test_batched_pipes():
+    results = []
+    ref_slots = set()
+
+    def callback(**kwargs):
+        results.append(kwargs)
+
+    cls1 = make_custom_node(
+        output_slots={"out1": DataType.ARRAY, "out2": DataType.ARRAY}, params={"common": {"autotrigger": True}}
+    )
+    cls2 = make_custom_node(input_slots={"in1": DataType.ARRAY, "in2": DataType.ARRAY}, process_callback=callback)
+
+    ref1, _ = cls1.create_local()
+    ref2, _ = cls2.create_local()
+
+    # the node reference receives the data of both output slots as a single DATA_BATCH message
+    ref1.set_message_handler(MessageType.DATA, lambda _, msg: ref_slots.add(msg.content["slot_name"]))
+
+    # connect both output slots to the same node
+    for slot_out, slot_in in [("out1", "in1"), ("out2", "in2")]:
+        ref1.connection.send(
+            Message(
+                MessageType.ADD_OUTPUT_PIPE,
+                {"slot_name_out": slot_out, "slot_name_in": slot_in, "node_connection": ref2.connection},
+            )
+        )
+
+    time.sleep(0.1)
+
+    assert ref_slots == {"out1", "out2"}, "Node reference should receive the data of all output slots."
+    assert any(r["in1"] is not None and r["in2"] is not None for r in results), "Batched data should update both input slots."
+
+    ref1.terminate()
+    ref2.terminate()
+
+
 @pytest.mark.parametrize("value", [10.0, 100.0])
 def test_change_parameter(value):
     ref, n = DummyNode.create_local()
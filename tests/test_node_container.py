@@ -77,3 +77,24 @@ def test_remove_node():
         cont.remove_node(None)
     with pytest.raises(KeyError):
         cont.remove_node(1)
+
+
+def test_unique_names():
+    cont = NodeContainer()
+    refs = [DummyNode.create_local()[0] for _ in range(4)]
+
+    cont.add_node("test", refs[0])
+    cont.add_node("test", refs[1])
+    cont.remove_node("test1")
+
+    # suffixes of removed nodes are not reused
+    assert cont.add_node("test", refs[2]) == "test2", "Suffix of a removed node was reused"
+
+    # skip suffixes that were taken by forcing the name
+    cont.add_node("test3", refs[3], force_name=True)
+    ref = DummyNode.create_local()[0]
+    assert cont.add_node("test", ref) == "test4", "Generated name collides with a forced name"
+
+    for name in list(cont):
+        cont.remove_node(name)
+    refs[1].terminate()